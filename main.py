@@ -1,4 +1,5 @@
 import json
+import os
 
 
 def create_gtfs_ontology(class_name, source_file, fields):
@@ -8,18 +9,19 @@ def create_gtfs_ontology(class_name, source_file, fields):
     }
 
     for field in fields:
+        foreign_key = field.get("foreign_key")
         node = {
             "id": field["name"],
             "label": field["name"],
-            "type": "objectProperty" if field.get("foreign_key") else "datatypeProperty",
+            "type": "objectProperty" if foreign_key else "datatypeProperty",
             "value_type": field["value_type"],
             "required": field["required"],
             "description": field["description"],
             "gtfs_type": field["gtfs_type"]
         }
 
-        if field.get("foreign_key"):
-            node["target_class"] = field["foreign_key"]
+        if foreign_key:
+            node["target_class"] = foreign_key
         if field.get("enum_values"):
             node["enum_values"] = field["enum_values"]
 
@@ -50,5 +52,6 @@ routes_fields = [
 
 ontology = create_gtfs_ontology("Route", "routes.txt", routes_fields)
 
-with open("routes_ontology.json", "w", encoding="utf-8") as f:
+with open("routes_ontology.json.tmp", "w", encoding="utf-8") as f:
     json.dump(ontology, f, indent=2, ensure_ascii=False)
+os.replace("routes_ontology.json.tmp", "routes_ontology.json")